@@ -1,73 +1,197 @@
-from abc import ABC, abstractmethod
-import random
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import Protocol, Sequence
 
+import numpy as np
 
-class PricedItem(ABC):
+try:
+    # Optional Cython kernel, built with: python setup.py build_ext --inplace
+    from pricing import discount_inplace
+
+    _HAVE_PRICING_EXT = True
+except ImportError:
+    _HAVE_PRICING_EXT = False
+
+try:
+    from numba import njit
+
+    _HAVE_NUMBA = True
+except ImportError:
+    # Numba is optional: without it the bulk kernel falls back to NumPy ufuncs
+    _HAVE_NUMBA = False
+
+
+# Shared PCG64 generator; one C call can fill a whole array of page counts
+_RNG = np.random.default_rng()
+
+
+def _random_page_count() -> int:
+    """
+    Generate a random page count for a single book.
+    Returns:
+        int: A random number between 100 and 1000
     """
-    Abstract base class representing items that have a price.
+    return int(_RNG.integers(100, 1001))
 
-    This class demonstrates Python's approach to interfaces using abstract base classes (ABC).
-    Key differences from Go interfaces:
-    1. Python uses explicit abstract base classes with @abstractmethod decorators
-    2. Go interfaces are implicit - types automatically implement interfaces by having matching methods
-    3. Python requires explicit inheritance (class Book(PricedItem)), while Go doesn't
-    4. Python's ABC provides compile-time type checking and runtime enforcement
+
+def _validate_pct(p: float) -> None:
+    """
+    Reject discount percentages outside 0-100, including NaN.
+
+    Call once at the public API boundary; batch paths that already hold a
+    validated factor skip it entirely.
+    Args:
+        p (float): Discount percentage
+    Raises:
+        ValueError: If p is NaN or outside 0-100
+    """
+    # p != p is an inlined isnan(); valid input falls straight through
+    if p != p or p < 0.0 or p > 100.0:
+        raise ValueError("Percentage must be between 0 and 100")
+
+
+@lru_cache(maxsize=128)
+def _discount_factor(percentage: float) -> float:
+    """
+    Validate a discount percentage and convert it to a price multiplier.
+
+    Memoized on the percentage alone: catalogs reuse a handful of discount
+    percentages, so repeat calls skip validation and arithmetic entirely.
+    Args:
+        percentage (float): Discount percentage (0-100)
+    Returns:
+        float: The factor to multiply a price by (e.g. 0.8 for 20%)
+    Raises:
+        ValueError: If the percentage is outside 0-100
+    """
+    _validate_pct(percentage)
+    return 1.0 - percentage * 0.01
+
+
+if _HAVE_PRICING_EXT:
+
+    def _bulk_discount(prices, factor, magazine_rule):
+        """
+        Discount an array of prices with the ahead-of-time compiled Cython kernel.
+        Args:
+            prices (np.ndarray): float64 prices (left unchanged)
+            factor (float): Price multiplier from _discount_factor()
+            magazine_rule (bool): Take an extra 10% off prices over $10
+        Returns:
+            np.ndarray: Discounted prices (float64)
+        """
+        out = np.array(prices, dtype=np.float64, order="C")
+        discount_inplace(out, factor, magazine_rule)
+        return out
+
+elif _HAVE_NUMBA:
+
+    @njit(cache=True)
+    def _bulk_discount(prices, factor, magazine_rule):
+        """
+        Discount an array of prices in one JIT-compiled loop.
+        Args:
+            prices (np.ndarray): float64 prices
+            factor (float): Price multiplier from _discount_factor()
+            magazine_rule (bool): Take an extra 10% off prices over $10
+        Returns:
+            np.ndarray: Discounted prices (float64)
+        """
+        out = np.empty_like(prices)
+        for i in range(prices.shape[0]):
+            discounted = prices[i] * factor
+            if magazine_rule and prices[i] > 10.0:
+                discounted *= 0.9
+            out[i] = discounted
+        return out
+
+else:
+
+    def _bulk_discount(prices, factor, magazine_rule):
+        """
+        NumPy fallback for the compiled kernels above.
+
+        The over-$10 rule is applied branchlessly with np.where instead of a
+        per-element Python if, which would be both slow and hard to predict.
+        """
+        base = prices * factor
+        if not magazine_rule:
+            return base
+        return np.where(prices > 10.0, base * 0.9, base)
+
+
+class PricedItem(Protocol):
+    """
+    Structural interface for items that have a price.
+
+    This class demonstrates Python's closest equivalent to Go interfaces: typing.Protocol.
+    Key similarities with Go interfaces:
+    1. Implementation is implicit - any class with matching methods satisfies the protocol
+    2. No inheritance needed: Book and Magazine are plain classes
+    3. Checking happens statically (type checkers / IDEs), not at runtime
+       - Deliberately not @runtime_checkable: its isinstance() inspects every
+         protocol member on each call, far slower than an ABC's subclass cache
+    4. Unlike an ABC, there is no metaclass work when constructing Book or Magazine
 
     All implementing classes must define:
     - get_price(): Retrieves the current price
-    - set_price(): Updates the price with validation
+    - with_price(): Returns a copy with a new, validated price
     - calculate_discount(): Computes discounted prices with custom logic
     """
 
-    @abstractmethod
+    # Empty slots so that classes subclassing the protocol explicitly
+    # (allowed, though Book and Magazine don't) keep a __dict__-free layout
+    __slots__ = ()
+
     def get_price(self) -> float:
         """Get the item's price"""
-        pass
+        ...
 
-    @abstractmethod
-    def set_price(self, price: float) -> None:
-        """Set the item's price"""
-        pass
+    def with_price(self, price: float) -> "PricedItem":
+        """Return a copy of the item with a new price"""
+        ...
 
-    @abstractmethod
     def calculate_discount(self, percentage: float) -> float:
         """Calculate discounted price"""
-        pass
+        ...
 
 
-class Book(PricedItem):
-    # Class-level constant representing the category code for all books
-    CATEGORY_CODE = "BOOK"
+@dataclass(slots=True, frozen=True)
+class Book:
+    """
+    Immutable book record.
 
-    def __init__(self, title, author, price, seller=None):
-        """
-        Initialize a new Book instance.
+    This class demonstrates Python's dataclasses as the closest match to Go structs:
+    1. Fields are declared up front with type annotations
+       - The generated __init__, __repr__, __eq__ and __hash__ come from these declarations
+       - Similar to a Go struct definition plus its zero-cost composite literal
 
-        This constructor demonstrates Python's approach to object attributes:
-        1. Protected attributes (_title, _author, _price) using single underscore
-           - Not truly private, but indicates "internal use" by convention
-           - Similar to unexported fields in Go (lowercase first letter)
+    2. slots=True gives a fixed attribute layout with no per-instance __dict__
 
-        2. Public attributes (seller) with no underscore
-           - Directly accessible, similar to exported fields in Go (uppercase first letter)
+    3. frozen=True makes instances immutable and hashable
+       - Books can be used as dict keys or set members
+       - "Modifying" a book means building a new one (see with_price)
 
-        3. Dynamic attribute creation (_page_count)
-           - Shows Python's flexible object model
-           - Different from Go's strict struct definition
+    Args:
+        title (str): The title of the book
+        author (str): The author's name
+        price (float): The book's price (must be non-negative)
+        seller (str, optional): The seller's name. Defaults to None.
+        page_count (int, optional): Defaults to a random page count.
+    """
 
-        Args:
-            title (str): The title of the book
-            author (str): The author's name
-            price (float): The book's price (must be non-negative)
-            seller (str, optional): The seller's name. Defaults to None.
-        """
-        self._title = title
-        self._author = author
-        self._price = price
-        self._page_count = self.random_page_count()
-        # seller is intentionally not private (no underscore)
-        # to demonstrate different attribute access patterns
-        self.seller = seller
+    title: str
+    author: str
+    price: float
+    seller: str | None = None
+    page_count: int = field(default_factory=_random_page_count)
+
+    # Class-level constant representing the category code for all books;
+    # read it directly as Book.CATEGORY_CODE (no accessor method needed)
+    CATEGORY_CODE = "BOOK"
+
+    # printf-style template for summary(); formatted by a single C call
+    _SUMMARY_FMT = "%s by %s - $%.2f"
 
     def summary(self):
         """
@@ -75,94 +199,194 @@ class Book(PricedItem):
         Returns:
             str: A string with title, author, and price information
         """
-        return f"{self._title} by {self._author} - ${self._price:.2f}"
+        return Book._SUMMARY_FMT % (self.title, self.author, self.price)
 
     def get_price(self) -> float:
         """
         Getter method for the book's price.
+
+        Kept for the PricedItem interface; reading book.price directly is cheaper.
         Returns:
             float: The current price of the book
         """
-        return self._price
+        return self.price
 
-    def set_price(self, price: float) -> None:
+    def with_price(self, price: float) -> "Book":
         """
-        Setter method for the book's price.
+        Return a copy of the book with a new price.
         Args:
             price (float): The new price to set
+        Returns:
+            Book: A new Book; the original is left unchanged
         Raises:
             ValueError: If the price is negative
         """
         if price < 0:
             raise ValueError("Price cannot be negative")
-        self._price = price
+        return replace(self, price=price)
 
-    @classmethod
-    def get_category_code(cls):
+    @staticmethod
+    def random_page_counts(n: int) -> np.ndarray:
         """
-        Class method to retrieve the category code.
+        Generate page counts for n books at once.
+        Args:
+            n (int): How many page counts to generate
         Returns:
-            str: The category code for all books
+            np.ndarray: n random int32 values between 100 and 1000
         """
-        return cls.CATEGORY_CODE
+        return _RNG.integers(100, 1001, size=n, dtype=np.int32)
 
-    @staticmethod
-    def random_page_count():
+    # Add this method to fulfill the PricedItem interface
+    def calculate_discount(self, percentage: float) -> float:
         """
-        Static method to generate a random page count.
+        Calculate the discounted price
+        Args:
+            percentage (float): Discount percentage (0-100)
         Returns:
-            int: A random number between 100 and 1000
+            float: Discounted price
         """
-        return random.randint(100, 1000)
+        return self.price * _discount_factor(percentage)
 
-    @property
-    def page_count(self):
+    def calculate_discount_factor(self, factor: float) -> float:
         """
-        Property getter for page count.
+        Fast path for batch pricing: apply a precomputed discount factor.
 
-        Demonstrates Python's property decorator system:
-        1. @property creates a getter method that's accessed like an attribute
-        2. Different from Go, which uses explicit GetPageCount() methods
-        3. Provides encapsulation while maintaining clean syntax
+        The factor is not validated; compute it once with _discount_factor()
+        and reuse it for every item discounted at the same percentage.
+        Args:
+            factor (float): Price multiplier (e.g. 0.8 for a 20% discount)
+        Returns:
+            float: Discounted price
+        """
+        return self.price * factor
 
+    @staticmethod
+    def batch_discounted_prices(books: Sequence["Book"], percentage: float) -> np.ndarray:
+        """
+        Discount a whole catalog of books in one vectorized operation.
+
+        Equivalent to [b.calculate_discount(percentage) for b in books], but
+        the percentage is validated once and the multiply runs in _bulk_discount.
+        Args:
+            books (Sequence[Book]): The books to price
+            percentage (float): Discount percentage (0-100)
         Returns:
-            int: The current page count
+            np.ndarray: Discounted prices (float64), in the order of books
         """
-        return self._page_count
+        factor = _discount_factor(percentage)
+        prices = np.fromiter((b.price for b in books), dtype=np.float64, count=len(books))
+        return _bulk_discount(prices, factor, False)
 
-    @page_count.setter
-    def page_count(self, value):
+
+class BookCatalog:
+    """
+    Column-oriented (structure-of-arrays) collection of books.
+
+    Instead of one Book object per book, each attribute lives in its own column.
+    Pricing only touches the contiguous prices array, so a price scan doesn't drag
+    titles, authors and sellers through the cache.
+
+    Compare with Go:
+    - Similar to a struct of slices: type BookCatalog struct { Prices []float64; ... }
+    - Python lists hold object pointers; the NumPy columns hold raw values like Go slices
+    """
+
+    def __init__(self):
+        self.titles: list[str] = []
+        self.authors: list[str] = []
+        self.prices = np.empty(0, dtype=np.float64)
+        self.page_counts = np.empty(0, dtype=np.int32)
+        self.sellers: list[str | None] = []
+
+    def __len__(self):
+        return len(self.titles)
+
+    @classmethod
+    def from_books(cls, books):
         """
-        Property setter for page count.
+        Build a catalog from existing Book objects in a single pass.
         Args:
-            value (int): The new page count to set
+            books (Iterable[Book]): The books to store
+        Returns:
+            BookCatalog: A catalog with one row per book
         """
-        self._page_count = value
+        catalog = cls()
+        prices = []
+        page_counts = []
+        for book in books:
+            catalog.titles.append(book.title)
+            catalog.authors.append(book.author)
+            catalog.sellers.append(book.seller)
+            prices.append(book.price)
+            page_counts.append(book.page_count)
+        catalog.prices = np.array(prices, dtype=np.float64)
+        catalog.page_counts = np.array(page_counts, dtype=np.int32)
+        return catalog
 
-    @page_count.deleter
-    def page_count(self):
+    @classmethod
+    def from_records(cls, records):
         """
-        Property deleter for page count.
-        Removes the page count attribute from the instance
+        Build a catalog of new books without creating Book objects.
+
+        Page counts for all rows come from a single Book.random_page_counts() call.
+        Args:
+            records (Sequence[tuple]): (title, author, price, seller) tuples
+        Returns:
+            BookCatalog: A catalog with one row per record
+        """
+        catalog = cls()
+        for title, author, _, seller in records:
+            catalog.titles.append(title)
+            catalog.authors.append(author)
+            catalog.sellers.append(seller)
+        catalog.prices = np.fromiter((r[2] for r in records), dtype=np.float64, count=len(records))
+        catalog.page_counts = Book.random_page_counts(len(records))
+        return catalog
+
+    def add_book(self, book):
         """
-        del self._page_count
+        Append a single book to the catalog.
 
-    # Add this method to fulfill the PricedItem interface
-    def calculate_discount(self, percentage: float) -> float:
+        Growing the NumPy columns copies them, so prefer from_books() for bulk loads.
+        Args:
+            book (Book): The book to add
         """
-        Calculate the discounted price
+        self.titles.append(book.title)
+        self.authors.append(book.author)
+        self.sellers.append(book.seller)
+        self.prices = np.append(self.prices, book.price)
+        self.page_counts = np.append(self.page_counts, np.int32(book.page_count))
+
+    def discounted_prices(self, percentage: float) -> np.ndarray:
+        """
+        Discount every book in the catalog.
         Args:
             percentage (float): Discount percentage (0-100)
         Returns:
-            float: Discounted price
+            np.ndarray: Discounted prices (float64), one per row
+        """
+        return _bulk_discount(self.prices, _discount_factor(percentage), False)
+
+    def view(self, i: int) -> Book:
+        """
+        Reconstruct a Book object for row i, for code that needs one.
+        Args:
+            i (int): Row index
+        Returns:
+            Book: A new Book with the row's values
         """
-        if not 0 <= percentage <= 100:
-            raise ValueError("Percentage must be between 0 and 100")
-        return self._price * (1 - percentage / 100)
+        return Book(
+            self.titles[i],
+            self.authors[i],
+            float(self.prices[i]),
+            self.sellers[i],
+            int(self.page_counts[i]),
+        )
 
 
 # Add another class that implements the same interface
-class Magazine(PricedItem):
+@dataclass(slots=True, frozen=True)
+class Magazine:
     """
     Magazine class implementing the PricedItem interface.
 
@@ -172,35 +396,52 @@ class Magazine(PricedItem):
     3. Polymorphic behavior: Can be used anywhere PricedItem is expected
 
     Compare with Go:
-    - Go would implicitly implement the interface by matching method signatures
-    - Python requires explicit inheritance from PricedItem
+    - Both Go and Python (via Protocol) implement the interface implicitly
+      by matching method signatures
     - Both approaches achieve similar polymorphic behavior
     """
 
-    def __init__(self, name: str, price: float, issue_number: int):
-        self._name = name
-        self._price = price
-        self._issue_number = issue_number
+    name: str
+    price: float
+    issue_number: int
 
     def get_price(self) -> float:
-        return self._price
+        return self.price
 
-    def set_price(self, price: float) -> None:
+    def with_price(self, price: float) -> "Magazine":
         if price < 0:
             raise ValueError("Price cannot be negative")
-        self._price = price
+        return replace(self, price=price)
 
     def calculate_discount(self, percentage: float) -> float:
-        if not 0 <= percentage <= 100:
-            raise ValueError("Percentage must be between 0 and 100")
+        return self.calculate_discount_factor(_discount_factor(percentage))
+
+    def calculate_discount_factor(self, factor: float) -> float:
         # Magazines have a different discount calculation
         # (just as an example of different implementations)
-        base_discount = self._price * (1 - percentage / 100)
+        base_discount = self.price * factor
         # Additional 10% off for magazines over $10
-        if self._price > 10:
+        if self.price > 10:
             return base_discount * 0.9
         return base_discount
 
+    @staticmethod
+    def batch_discounted_prices(magazines: Sequence["Magazine"], percentage: float) -> np.ndarray:
+        """
+        Vectorized counterpart of calculate_discount for many magazines.
+
+        The over-$10 rule is applied inside _bulk_discount: in a compiled loop
+        with Cython or Numba, or branchlessly with np.where without them.
+        Args:
+            magazines (Sequence[Magazine]): The magazines to price
+            percentage (float): Discount percentage (0-100)
+        Returns:
+            np.ndarray: Discounted prices (float64), in the order of magazines
+        """
+        factor = _discount_factor(percentage)
+        prices = np.fromiter((m.price for m in magazines), dtype=np.float64, count=len(magazines))
+        return _bulk_discount(prices, factor, True)
+
 
 def print_item_price_info(item: PricedItem):
     """
@@ -215,7 +456,7 @@ def print_item_price_info(item: PricedItem):
     Compare with Go:
     - Go: func printItemPriceInfo(item PricedItem)
     - Both languages allow any type implementing the interface
-    - Go enforces this at compile-time, Python at runtime
+    - Go enforces this at compile-time, Python via static type checkers
 
     Args:
         item (PricedItem): Any object implementing the PricedItem interface
@@ -229,8 +470,8 @@ def main():
     Main function demonstrating the usage of the Book class.
     Shows various operations including:
     - Creating a book
-    - Getting and setting prices
-    - Using properties
+    - Getting prices and deriving re-priced copies
+    - Working with immutable (frozen) fields
     - Handling errors
     - Working with the public seller attribute
     """
@@ -243,39 +484,42 @@ def main():
     # Demonstrate direct access to public seller attribute
     print("Original Seller:", harry_potter.seller)
 
-    # Modify seller directly (possible because it's a public attribute)
-    harry_potter.seller = "Obscurus Books"
+    # Books are frozen, so "modifying" the seller builds an updated copy
+    harry_potter = replace(harry_potter, seller="Obscurus Books")
     print("New Seller:", harry_potter.seller)
 
-    # Demonstrate price setting with error handling
+    # Demonstrate re-pricing with error handling
     try:
-        harry_potter.set_price(12.99)
+        harry_potter = harry_potter.with_price(12.99)
     except ValueError as e:
         print("Error:", e)
 
     # Print the updated summary
     print(harry_potter.summary())
 
-    # Demonstrate getter method
-    print("Price:", harry_potter.get_price())
+    # Demonstrate direct price access (get_price() remains as an alias)
+    print("Price:", harry_potter.price)
 
-    # Demonstrate class method
-    print("Category Code:", Book.get_category_code())
+    # Demonstrate class-level constant access
+    print("Category Code:", Book.CATEGORY_CODE)
 
-    # Demonstrate property getter
+    # Demonstrate plain field read
     print("Page Count:", harry_potter.page_count)
 
-    # Demonstrate property setter
-    harry_potter.page_count = 500
+    # Demonstrate an immutable update
+    harry_potter = replace(harry_potter, page_count=500)
     print("Updated Page Count:", harry_potter.page_count)
 
-    # Demonstrate property deleter and error handling
-    del harry_potter.page_count
+    # Demonstrate that frozen fields can't be deleted
     try:
-        print("Deleted Page Count:", harry_potter.page_count)
+        del harry_potter.page_count
     except AttributeError as e:
         print("Error:", e)
 
+    # Frozen dataclasses are hashable, so books can key a dict
+    stock = {harry_potter: 3}
+    print("In Stock:", stock[harry_potter])
+
     # Add magazine demo
     vogue = Magazine("Vogue", 12.99, 123)
 
@@ -286,6 +530,21 @@ def main():
     print("\nMagazine pricing:")
     print_item_price_info(vogue)
 
+    # Batch pricing: one vectorized call instead of a Python loop
+    books = [harry_potter, Book("The Hobbit", "J.R.R. Tolkien", 8.50)]
+    magazines = [vogue, Magazine("Wired", 5.99, 42)]
+
+    print("\n=== Demonstrating batch pricing ===")
+    print("Books with 20% discount:", Book.batch_discounted_prices(books, 20).round(2))
+    print("Magazines with 20% discount:", Magazine.batch_discounted_prices(magazines, 20).round(2))
+
+    # Column-oriented catalog: prices are stored in one contiguous array
+    catalog = BookCatalog.from_books(books[1:])
+    catalog.add_book(Book("Dune", "Frank Herbert", 9.99, "Arrakis Books"))
+    print("Catalog size:", len(catalog))
+    print("Catalog with 20% discount:", catalog.discounted_prices(20).round(2))
+    print("Catalog row 1:", catalog.view(1).summary())
+
 
 if __name__ == "__main__":
     main()
@@ -300,7 +559,8 @@ Price: 12.99
 Category Code: BOOK
 Page Count: 437
 Updated Page Count: 500
-Error: 'Book' object has no attribute '_page_count'
+Error: cannot delete field 'page_count'
+In Stock: 3
 
 === Demonstrating interface-like behavior ===
 Book pricing:
@@ -310,4 +570,11 @@ Price with 20% discount: $10.39
 Magazine pricing:
 Original price: $12.99
 Price with 20% discount: $9.35
+
+=== Demonstrating batch pricing ===
+Books with 20% discount: [10.39  6.8 ]
+Magazines with 20% discount: [9.35 4.79]
+Catalog size: 2
+Catalog with 20% discount: [6.8  7.99]
+Catalog row 1: Dune by Frank Herbert - $9.99
 """
@@ -0,0 +1,7 @@
+# Type stub for the optional Cython extension built from pricing.pyx
+import numpy as np
+import numpy.typing as npt
+
+def discount_inplace(
+    prices: npt.NDArray[np.float64], factor: float, magazine_rule: bool
+) -> None: ...
@@ -0,0 +1,19 @@
+"""
+Builds the optional Cython pricing kernel:
+    python setup.py build_ext --inplace
+"""
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+setup(
+    ext_modules=cythonize(
+        [
+            Extension(
+                "pricing",
+                ["pricing.pyx"],
+                extra_compile_args=["-O3"],
+            )
+        ],
+        language_level=3,
+    ),
+)